@@ -1,11 +1,17 @@
 import requests
 from collections import defaultdict, deque
 import sys
+from ResultCache import ResultCache
+from SharedLexicon import letter_mask
 
 # Adjust the recursion limit if necessary
 sys.setrecursionlimit(10000)
 
 
+# Part of the result cache key, bump it when the dictionary source changes
+lexicon_version = "sowpods-redbo-scrabble-master"
+
+
 # Download SOWPODS dictionary
 def download_sowpods():
     url = "https://raw.githubusercontent.com/redbo/scrabble/master/dictionary.txt"
@@ -53,13 +59,30 @@ class Trie:
         return True
 
 
+# Board-specific sub-lexicon: keep only words spelled from the board's letters
+# that never chain two letters from the same side
+def prefilter_words(word_list, letters, max_word_length):
+    letter_sides = {}
+    for idx, row in enumerate(letters):
+        for letter in row:
+            letter_sides.setdefault(letter.upper(), set()).add(idx)
+    board_letters = set(letter_sides)
+    survivors = []
+    for word in word_list:
+        if not 3 <= len(word) <= max_word_length or not board_letters.issuperset(word):
+            continue
+        if any(letter_sides[a] & letter_sides[b] for a, b in zip(word, word[1:])):
+            continue
+        survivors.append(word)
+    return survivors
+
+
 # Load the dictionary into a trie for efficient lookup
-def load_dictionary(max_word_length):
+def load_dictionary(max_word_length, letters):
     word_list = download_sowpods()
     trie = Trie()
-    for word in word_list:
-        if 3 <= len(word) <= max_word_length and word.isalpha():
-            trie.insert(word)
+    for word in prefilter_words(word_list, letters, max_word_length):
+        trie.insert(word)
     return trie
 
 
@@ -94,6 +117,51 @@ def generate_valid_words(letters, trie, max_word_length):
     return list(valid_words)
 
 
+# Meet-in-the-middle fast path for one-, two- and three-word answers. Words are indexed by
+# first and last letter, grouped by letter mask, so each join only compares distinct masks.
+# Stops joining once max_solutions answers of the minimal length are found.
+def find_short_solutions(valid_words, total_letters, max_words=3, max_solutions=10):
+    full_mask = letter_mask(total_letters)
+    words_by_first = defaultdict(lambda: defaultdict(list))
+    words_by_last = defaultdict(lambda: defaultdict(list))
+    word_masks = []
+    for word, _ in valid_words:
+        mask = letter_mask(word)
+        word_masks.append((word, mask))
+        words_by_first[word[0]][mask].append(word)
+        words_by_last[word[-1]][mask].append(word)
+
+    solutions = [[word] for word, mask in word_masks if mask == full_mask]
+    if solutions or max_words < 2:
+        return sorted(solutions)[:max_solutions]
+
+    # Two words: the second word must start with the first word's last letter and cover the rest
+    for word, mask in word_masks:
+        needed = full_mask & ~mask
+        for next_mask, next_words in words_by_first[word[-1]].items():
+            if next_mask & needed == needed:
+                solutions.extend([word, next_word] for next_word in next_words if next_word != word)
+                if len(solutions) >= max_solutions:
+                    return sorted(solutions[:max_solutions])
+    if solutions or max_words < 3:
+        return sorted(solutions)
+
+    # Three words: join the words ending where each middle word starts with those starting where it ends
+    for word, mask in word_masks:
+        next_groups = words_by_first[word[-1]].items()
+        for prev_mask, prev_words in words_by_last[word[0]].items():
+            needed = full_mask & ~(prev_mask | mask)
+            for next_mask, next_words in next_groups:
+                if next_mask & needed == needed:
+                    solutions.extend(
+                        [prev_word, word, next_word]
+                        for prev_word in prev_words if prev_word != word
+                        for next_word in next_words if next_word != word)
+                    if len(solutions) >= max_solutions:
+                        return sorted(solutions[:max_solutions])
+    return sorted(solutions)
+
+
 # Build the word graph
 def build_word_graph(valid_words):
     graph = defaultdict(list)
@@ -143,15 +211,28 @@ def find_sequences(graph, word_letter_sets, total_letters, max_solutions=10):
 
 
 # Main function to solve the puzzle
-def solve_puzzle(letters, max_word_length=8, max_solutions=10):
-    trie = load_dictionary(max_word_length)
-    valid_words = generate_valid_words(letters, trie, max_word_length)
-    if not valid_words:
-        print("No valid words found with the given letters and dictionary.")
-        return
-    graph, word_letter_sets = build_word_graph(valid_words)
-    total_letters = frozenset(''.join(letter.upper() for row in letters for letter in row))
-    sequences = find_sequences(graph, word_letter_sets, total_letters, max_solutions)
+def solve_puzzle(letters, max_word_length=8, max_solutions=10, cache=None):
+    # Reuse the cached answer when this board was solved before with the same parameters
+    sequences = None
+    if cache is not None:
+        board = [[letter.upper() for letter in row] for row in letters]
+        cache_key = cache.make_key('LetterBoxed', board, lexicon_version,
+                                   max_word_length=max_word_length, max_solutions=max_solutions)
+        sequences = cache.get(cache_key)
+    if sequences is None:
+        trie = load_dictionary(max_word_length, letters)
+        valid_words = generate_valid_words(letters, trie, max_word_length)
+        if not valid_words:
+            print("No valid words found with the given letters and dictionary.")
+            return
+        total_letters = frozenset(''.join(letter.upper() for row in letters for letter in row))
+        sequences = find_short_solutions(valid_words, total_letters, max_solutions=max_solutions)
+        if not sequences:
+            # Fall back to the general search for answers longer than three words
+            graph, word_letter_sets = build_word_graph(valid_words)
+            sequences = find_sequences(graph, word_letter_sets, total_letters, max_solutions)
+        if cache is not None:
+            cache.put(cache_key, sequences)
     if sequences:
         print(f"Found {len(sequences)} optimal solution(s):\n")
         for idx, sequence in enumerate(sequences, 1):
@@ -172,4 +253,6 @@ letters = [
 ]
 max_word_length = 12  # You can adjust this value
 max_solutions = 10  # Number of optimal solutions to find
-solve_puzzle(letters, max_word_length, max_solutions)
+cache = ResultCache()
+solve_puzzle(letters, max_word_length, max_solutions, cache)
+print(f"Cache: {cache.stats()}")
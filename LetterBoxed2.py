@@ -2,11 +2,16 @@ import nltk
 from nltk.corpus import words
 from collections import defaultdict, deque
 import sys
+from ResultCache import ResultCache
 
 # Adjust the recursion limit if necessary
 sys.setrecursionlimit(10000)
 
 
+# Part of the result cache key
+lexicon_version = f"nltk-words-{nltk.__version__}"
+
+
 # Download NLTK data if not already present
 def download_nltk_data():
     try:
@@ -150,15 +155,25 @@ def find_full_solutions(graph, word_letter_sets, total_letters, max_solutions=20
 
 
 # Main function to solve the puzzle
-def solve_puzzle(letters, max_word_length=8, max_solutions=20):
-    trie = load_dictionary(max_word_length)
-    valid_words = generate_valid_words(letters, trie, max_word_length)
-    if not valid_words:
-        print("No valid words found with the given letters and dictionary.")
-        return
-    graph, word_letter_sets = build_word_graph(valid_words)
-    total_letters = frozenset(''.join(letter.upper() for row in letters for letter in row))
-    full_solutions = find_full_solutions(graph, word_letter_sets, total_letters, max_solutions)
+def solve_puzzle(letters, max_word_length=8, max_solutions=20, cache=None):
+    # Reuse the cached answer when this board was solved before with the same parameters
+    full_solutions = None
+    if cache is not None:
+        board = [[letter.upper() for letter in row] for row in letters]
+        cache_key = cache.make_key('LetterBoxed2', board, lexicon_version,
+                                   max_word_length=max_word_length, max_solutions=max_solutions)
+        full_solutions = cache.get(cache_key)
+    if full_solutions is None:
+        trie = load_dictionary(max_word_length)
+        valid_words = generate_valid_words(letters, trie, max_word_length)
+        if not valid_words:
+            print("No valid words found with the given letters and dictionary.")
+            return
+        graph, word_letter_sets = build_word_graph(valid_words)
+        total_letters = frozenset(''.join(letter.upper() for row in letters for letter in row))
+        full_solutions = find_full_solutions(graph, word_letter_sets, total_letters, max_solutions)
+        if cache is not None:
+            cache.put(cache_key, full_solutions)
 
     if full_solutions:
         print(f"Found {len(full_solutions)} full solution(s) using all letters:\n")
@@ -177,4 +192,6 @@ letters = [
     ["U", "R", "W"],  # Row 3
 ]
 max_word_length = 12  # You can adjust this value
-solve_puzzle(letters, max_word_length, max_solutions=20)
+cache = ResultCache()
+solve_puzzle(letters, max_word_length, max_solutions=20, cache=cache)
+print(f"Cache: {cache.stats()}")
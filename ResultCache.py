@@ -0,0 +1,95 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+# Default location and size bound for cached solver results
+default_cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'game-solvers')
+default_max_bytes = 64 * 1024 * 1024
+
+
+# Content-addressed on-disk cache for solver results with size-bounded LRU eviction
+class ResultCache:
+    def __init__(self, cache_dir=default_cache_dir, max_bytes=default_max_bytes):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    # The key is a hash of the solver name, the normalized puzzle, the lexicon version and the solver parameters
+    def make_key(self, solver, puzzle, lexicon, **params):
+        payload = json.dumps(
+            {'solver': solver, 'puzzle': puzzle, 'lexicon': lexicon, 'params': params},
+            sort_keys=True, default=sorted)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, key + '.pkl')
+
+    def get(self, key):
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            self.misses += 1
+            return None
+        # Touch the entry so eviction treats it as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        # Write to a temporary file and rename it so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.evict()
+
+    def entries(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.pkl'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue  # Removed by another process in the meantime
+            entries.append((stat.st_mtime, stat.st_size, name))
+        return entries
+
+    # Drop least recently used entries until the cache fits in max_bytes
+    def evict(self):
+        entries = sorted(self.entries())
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, name in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+                self.evictions += 1
+            except OSError:
+                pass
+            total_bytes -= size
+
+    def stats(self):
+        entries = self.entries()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+        }
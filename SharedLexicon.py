@@ -0,0 +1,201 @@
+import struct
+from array import array
+from multiprocessing import Pool, shared_memory
+
+# Block layout: header, word offsets, letter masks, trie child table, terminal flags, word text
+header_format = '4I'  # word count, text bytes, trie node count, reserved
+header_size = struct.calcsize(header_format)
+alphabet_size = 26
+
+
+# Bitmask of the distinct letters in a word (bit 0 is A), shared with the solver scripts
+def letter_mask(word):
+    mask = 0
+    for char in word:
+        mask |= 1 << (ord(char) - ord('A'))
+    return mask
+
+
+def align(offset):
+    return (offset + 7) & ~7
+
+
+# Compile the word table, letter masks and a flat trie (26 child slots per node, -1 for none)
+def compile_lexicon(word_list):
+    word_list = sorted({word.upper() for word in word_list if word.isascii() and word.isalpha()})
+    offsets = array('I', [0])
+    masks = array('I')
+    children = array('i', [-1] * alphabet_size)
+    terminal = bytearray(1)
+    for word in word_list:
+        offsets.append(offsets[-1] + len(word))
+        masks.append(letter_mask(word))
+        node = 0
+        for char in word:
+            slot = node * alphabet_size + ord(char) - ord('A')
+            if children[slot] == -1:
+                children[slot] = len(terminal)
+                children.extend([-1] * alphabet_size)
+                terminal.append(0)
+            node = children[slot]
+        terminal[node] = 1
+    text = ''.join(word_list).encode('ascii')
+    return offsets, masks, children, terminal, text
+
+
+# Read-only lexicon in a shared memory block that pool workers attach to without copying
+class SharedLexicon:
+    def __init__(self, shm, owner=False):
+        self.shm = shm
+        self.owner = owner
+        buf = shm.buf
+        self.word_count, self.text_bytes, self.node_count, _ = struct.unpack_from(header_format, buf)
+        sections = [
+            ('offsets', 'I', self.word_count + 1),
+            ('masks', 'I', self.word_count),
+            ('children', 'i', self.node_count * alphabet_size),
+            ('terminal', 'B', self.node_count),
+            ('text', 'B', self.text_bytes),
+        ]
+        offset = header_size
+        for attr, fmt, count in sections:
+            offset = align(offset)
+            size = count * struct.calcsize(fmt)
+            setattr(self, attr, buf[offset:offset + size].cast(fmt))
+            offset += size
+
+    @classmethod
+    def create(cls, word_list, name=None):
+        offsets, masks, children, terminal, text = compile_lexicon(word_list)
+        parts = [offsets.tobytes(), masks.tobytes(), children.tobytes(), bytes(terminal), text]
+        size = header_size
+        for part in parts:
+            size = align(size) + len(part)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(size, 1))
+        struct.pack_into(header_format, shm.buf, 0, len(masks), len(text), len(terminal), 0)
+        offset = header_size
+        for part in parts:
+            offset = align(offset)
+            shm.buf[offset:offset + len(part)] = part
+            offset += len(part)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Before Python 3.13 attaching always registers with the resource tracker; pool
+            # workers share their parent's tracker, so the owner's unlink still cleans it up
+            shm = shared_memory.SharedMemory(name=name)
+        return cls(shm)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def root(self):
+        return SharedTrieNode(self, 0)
+
+    def __len__(self):
+        return self.word_count
+
+    def word(self, idx):
+        return bytes(self.text[self.offsets[idx]:self.offsets[idx + 1]]).decode('ascii')
+
+    def mask(self, idx):
+        return self.masks[idx]
+
+    # Words whose letters all appear in board_mask, without touching the word text of the others
+    def words_fitting(self, board_mask):
+        for idx in range(self.word_count):
+            if not self.masks[idx] & ~board_mask:
+                yield self.word(idx)
+
+    # Trie interface, matching Trie.starts_with / Trie.search in the solver scripts
+    def child(self, node, char):
+        if not 'A' <= char <= 'Z':
+            return -1
+        return self.children[node * alphabet_size + ord(char) - ord('A')]
+
+    def find_node(self, prefix):
+        node = 0
+        for char in prefix:
+            node = self.child(node, char)
+            if node == -1:
+                return -1
+        return node
+
+    def is_word(self, node):
+        return bool(self.terminal[node])
+
+    def starts_with(self, prefix):
+        return self.find_node(prefix) != -1
+
+    def search(self, word):
+        node = self.find_node(word)
+        return node != -1 and self.is_word(node)
+
+    def close(self):
+        for attr in ('offsets', 'masks', 'children', 'terminal', 'text'):
+            getattr(self, attr).release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+# Node view over the flat trie with the same shape as TrieNode in Strands.py
+# (node.children.get(letter), node.is_end_of_word), so its bitboard DFS can walk the shared store
+class SharedTrieNode:
+    __slots__ = ('lexicon', 'index')
+
+    def __init__(self, lexicon, index):
+        self.lexicon = lexicon
+        self.index = index
+
+    # Children are looked up in the shared child table, so the node acts as its own mapping
+    @property
+    def children(self):
+        return self
+
+    def get(self, char, default=None):
+        child = self.lexicon.child(self.index, char)
+        return default if child == -1 else SharedTrieNode(self.lexicon, child)
+
+    @property
+    def is_end_of_word(self):
+        return self.lexicon.is_word(self.index)
+
+
+# Pool initializer: each worker attaches to the shared block once and keeps it for its lifetime
+worker_lexicon = None
+
+
+def init_worker(name):
+    global worker_lexicon
+    worker_lexicon = SharedLexicon.attach(name)
+
+
+# Spelling Bee solved in a pool worker: the letter masks reject words without reading their text
+def solve_spelling_bee(puzzle):
+    letters, center_letter = puzzle
+    valid_words = [word for word in worker_lexicon.words_fitting(letter_mask(letters + center_letter))
+                   if center_letter in word]
+    return sorted(valid_words, key=lambda word: (-len(word), word))
+
+
+# Example usage: several Spelling Bee puzzles solved in parallel against one shared copy of the lexicon
+if __name__ == '__main__':
+    import nltk
+    from nltk.corpus import words
+
+    nltk.download('words')
+    lexicon = SharedLexicon.create(words.words())
+    puzzles = [('MOTBAR', 'H'), ('LAPCEN', 'I'), ('DUNGRO', 'A'), ('FIELDS', 'W')]
+    try:
+        with Pool(4, initializer=init_worker, initargs=(lexicon.name,)) as pool:
+            for (letters, center_letter), valid_words in zip(puzzles, pool.map(solve_spelling_bee, puzzles)):
+                print(f"{letters} + {center_letter}: {len(valid_words)} words, longest: {valid_words[:5]}")
+    finally:
+        lexicon.close()
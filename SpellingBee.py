@@ -1,15 +1,13 @@
 import itertools
+import nltk
 from nltk.corpus import words
+from ResultCache import ResultCache
 
 # Letters provided for the game
 letters = ['m', 'o', 't', 'b', 'a', 'r']
 center_letter = 'h'
 all_letters = letters + [center_letter]
 
-# Load English words from the nltk corpus (o another word list)
-word_list = set(words.words())
-
-
 # Function to check if a word is valid
 def is_valid_word(word):
     # Word must contain the center letter
@@ -29,15 +27,26 @@ def score_word(word):
     return score
 
 
-# Find all valid words
-valid_words = []
-for word in word_list:
-    word = word.lower()
-    if is_valid_word(word):
-        valid_words.append((word, score_word(word)))
+# Reuse the cached word list when these letters were solved before
+cache = ResultCache()
+cache_key = cache.make_key('SpellingBee', {'letters': sorted(letters), 'center': center_letter},
+                           f"nltk-words-{nltk.__version__}")
+valid_words = cache.get(cache_key)
+
+if valid_words is None:
+    # Load English words from the nltk corpus (o another word list)
+    word_list = set(words.words())
 
-# Sort valid words by score, then by length as a tie-breaker
-valid_words.sort(key=lambda x: (-x[1], -len(x[0])))
+    # Find all valid words
+    valid_words = []
+    for word in word_list:
+        word = word.lower()
+        if is_valid_word(word):
+            valid_words.append((word, score_word(word)))
+
+    # Sort valid words by score, then by length as a tie-breaker
+    valid_words.sort(key=lambda x: (-x[1], -len(x[0])))
+    cache.put(cache_key, valid_words)
 
 # Output the valid words
 print("Valid words found:")
@@ -50,3 +59,5 @@ if spangrams:
     print("\nBest spangram(s):")
     for spangram in spangrams:
         print(spangram)
+
+print(f"\nCache: {cache.stats()}")
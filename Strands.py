@@ -1,7 +1,8 @@
 import nltk
 import random
 from nltk.corpus import words
-from collections import defaultdict
+from collections import Counter, defaultdict
+from ResultCache import ResultCache
 
 # Ensure you have the words corpus downloaded
 nltk.download('words')
@@ -41,15 +42,6 @@ class Trie:
         return node.is_end_of_word
 
 
-# Load dictionary and create the Trie
-word_list = set(words.words())
-min_word_length = 4  # Filter shorter words
-trie = Trie()
-
-for word in word_list:
-    if len(word) >= min_word_length:
-        trie.insert(word.upper())
-
 # This is where you can manually input the board after solving part of the puzzle by adding `_` manually
 letters = [
     ['_', '_', '_', '_', '_', '_'],
@@ -62,10 +54,43 @@ letters = [
     ['H', '_', '_', '_', '_', '_']
 ]
 
+
+# Board-specific sub-lexicon: only words whose letters fit the board's letter multiset can be traced
+def prefilter_words(word_list, board):
+    board_counts = Counter(letter for row in board for letter in row if letter != '_')
+    board_letters = set(board_counts)
+    survivors = []
+    for word in word_list:
+        word = word.upper()
+        # Cheap set check first, exact letter counts only for the words that pass it
+        if len(word) < min_word_length or not board_letters.issuperset(word):
+            continue
+        word_counts = Counter(word)
+        if all(count <= board_counts[char] for char, count in word_counts.items()):
+            survivors.append(word)
+    return survivors
+
+
+min_word_length = 4  # Filter shorter words
+lexicon_version = f"nltk-words-{nltk.__version__}"  # Part of the result cache key
+cache_format = 2  # Bump when the layout of cached solutions changes
+
+
+# Load dictionary and create the Trie from the words that fit the board. Also returns the
+# longest word in the trie, which bounds how far a path can still travel.
+def load_dictionary(board):
+    word_list = set(words.words())
+    trie = Trie()
+    max_word_length = 0
+    for word in prefilter_words(word_list, board):
+        trie.insert(word)
+        max_word_length = max(max_word_length, len(word))
+    return trie, max_word_length
+
 rows = len(letters)
 cols = len(letters[0])
 
-# Precompute valid moves for each cell to optimize movement checks
+# Precompute valid moves for each cell, used to build the bitboard neighbor masks
 directions = [
     (-1, 0), (1, 0), (0, -1), (0, 1),  # vertical and horizontal
     (-1, -1), (-1, 1), (1, -1), (1, 1)  # diagonals
@@ -77,45 +102,83 @@ for i in range(rows):
         valid_moves[(i, j)] = [(i + di, j + dj) for di, dj in directions if 0 <= i + di < rows and 0 <= j + dj < cols]
 
 
-def find_words(i, j, visited, current_word, current_path):
-    if visited[i][j] or letters[i][j] == '_':  # Skip cells marked with '_'
-        return []
+# Bitboard engine: cell (i, j) is bit i * cols + j, so the board, visited set and paths are
+# plain integer masks (Python ints grow as needed, so any rectangular size works)
+def build_neighbor_masks():
+    masks = []
+    for i in range(rows):
+        for j in range(cols):
+            mask = 0
+            for ni, nj in valid_moves[(i, j)]:
+                mask |= 1 << (ni * cols + nj)
+            masks.append(mask)
+    return masks
+
 
-    current_word += letters[i][j]
-    current_path.append((i, j))
+neighbor_masks = build_neighbor_masks()
 
-    # Prune the search if it's not a valid prefix
-    if not trie.starts_with(current_word):
-        current_path.pop()
-        return []
 
-    found_words = []
-    if trie.search(current_word) and len(current_word) >= min_word_length:
-        found_words.append((current_word, list(current_path)))
+def board_mask():
+    mask = 0
+    for i in range(rows):
+        for j in range(cols):
+            if letters[i][j] != '_':
+                mask |= 1 << (i * cols + j)
+    return mask
+
+
+def path_mask(path):
+    mask = 0
+    for i, j in path:
+        mask |= 1 << (i * cols + j)
+    return mask
+
+
+def find_words_bitboard(cell, node, visited, current_word, current_path, open_mask, flat_letters, found_words):
+    letter = flat_letters[cell]
+    # Walk the trie one node at a time instead of re-checking the whole prefix from the root
+    node = node.children.get(letter)
+    if node is None:
+        return
+
+    current_word += letter
+    visited |= 1 << cell
+    current_path.append(cell)
+
+    if node.is_end_of_word and len(current_word) >= min_word_length:
+        found_words.append((current_word, [divmod(c, cols) for c in current_path]))
 
-    visited[i][j] = True
-    for ni, nj in valid_moves[(i, j)]:
-        found_words += find_words(ni, nj, visited, current_word, current_path)
+    moves = neighbor_masks[cell] & open_mask & ~visited
+    while moves:
+        low = moves & -moves
+        find_words_bitboard(low.bit_length() - 1, node, visited, current_word, current_path, open_mask, flat_letters, found_words)
+        moves ^= low
 
-    visited[i][j] = False
     current_path.pop()
-    return found_words
 
 
-def generate_all_words():
-    visited = [[False] * cols for _ in range(rows)]
+def generate_all_words_bitboard():
+    open_mask = board_mask()
+    flat_letters = [letter for row in letters for letter in row]
     all_words = []
-    for i in range(rows):
-        for j in range(cols):
-            all_words += find_words(i, j, visited, "", [])
+    cells = open_mask
+    while cells:
+        low = cells & -cells
+        find_words_bitboard(low.bit_length() - 1, trie.root, 0, "", [], open_mask, flat_letters, all_words)
+        cells ^= low
     return all_words
 
 
 # Greedy heuristic to find partial solutions
-def greedy_cover_matrix(word_list):
+def greedy_cover_matrix(word_list, seed=None):
     covered = set()
     selected_words = []
 
+    # Start from a preselected word (e.g. the spangram) when one is given
+    if seed:
+        covered.update(seed[1])
+        selected_words.append(seed[0])
+
     # Shuffle words to introduce randomness
     random.shuffle(word_list)
 
@@ -144,6 +207,14 @@ def greedy_cover_matrix(word_list):
     return selected_words, len(covered)
 
 
+# Solutions are (words, covered cells, spangram seed or None), shared by fresh and cached runs
+def print_solutions(solutions):
+    for idx, (solution, covered_cells, spangram) in enumerate(solutions, 1):
+        seed = f" (spangram {spangram})" if spangram else ""
+        print(
+            f"Solution {idx}{seed}: {solution} (Covered {covered_cells}/{rows * cols} cells, Used {len(solution)} words)")
+
+
 def find_multiple_solutions(word_list, num_solutions=3):
     solutions = []
     all_words = word_list[:]
@@ -151,9 +222,7 @@ def find_multiple_solutions(word_list, num_solutions=3):
     for _ in range(num_solutions):
         solution, covered_cells = greedy_cover_matrix(all_words)
         if solution:
-            solutions.append((solution, covered_cells))
-            print(
-                f"Solution {len(solutions)}: {solution} (Covered {covered_cells}/{rows * cols} cells, Used {len(solution)} words)")
+            solutions.append((solution, covered_cells, None))
 
             # Remove the selected words from the word list for the next solution
             all_words = [w for w in all_words if w[0] not in [sw for sw in solution]]
@@ -163,19 +232,212 @@ def find_multiple_solutions(word_list, num_solutions=3):
     return solutions
 
 
+# Spangram search: the spangram is the one word whose path touches two opposite edges of the board
+def edge_masks():
+    top = bottom = left = right = 0
+    for j in range(cols):
+        top |= 1 << j
+        bottom |= 1 << ((rows - 1) * cols + j)
+    for i in range(rows):
+        left |= 1 << (i * cols)
+        right |= 1 << (i * cols + cols - 1)
+    return [(top, bottom), (left, right)]
+
+
+# Breadth-first distance (in cells) from every open cell to the nearest open cell on the target edge
+def distance_to_edge(target_mask, open_mask):
+    dist = [None] * (rows * cols)
+    frontier = []
+    for cell in range(rows * cols):
+        if (target_mask & open_mask) >> cell & 1:
+            dist[cell] = 0
+            frontier.append(cell)
+    while frontier:
+        next_frontier = []
+        for cell in frontier:
+            moves = neighbor_masks[cell] & open_mask
+            while moves:
+                low = moves & -moves
+                neighbor = low.bit_length() - 1
+                if dist[neighbor] is None:
+                    dist[neighbor] = dist[cell] + 1
+                    next_frontier.append(neighbor)
+                moves ^= low
+        frontier = next_frontier
+    return dist
+
+
+# `touched` has bit 0 set once the path reaches the first edge and bit 1 once it reaches the second
+def find_spangrams(cell, node, visited, touched, current_word, current_path, open_mask, flat_letters, edges, dists, found_words):
+    letter = flat_letters[cell]
+    node = node.children.get(letter)
+    if node is None:
+        return
+
+    current_word += letter
+    visited |= 1 << cell
+    for side in (0, 1):
+        if edges[side] >> cell & 1:
+            touched |= 1 << side
+
+    # Prune paths that can no longer reach a missing edge within the longest word length
+    for side in (0, 1):
+        if not touched >> side & 1:
+            dist = dists[side][cell]
+            if dist is None or len(current_word) + dist > max_word_length:
+                return
+
+    current_path.append(cell)
+    if touched == 3 and node.is_end_of_word and len(current_word) >= min_word_length:
+        found_words.append((current_word, [divmod(c, cols) for c in current_path]))
+
+    moves = neighbor_masks[cell] & open_mask & ~visited
+    while moves:
+        low = moves & -moves
+        find_spangrams(low.bit_length() - 1, node, visited, touched, current_word, current_path, open_mask, flat_letters, edges, dists, found_words)
+        moves ^= low
+
+    current_path.pop()
+
+
+# Rank spangram candidates, longest first since the real spangram usually spans the whole board
+def generate_spangrams():
+    open_mask = board_mask()
+    flat_letters = [letter for row in letters for letter in row]
+    found_words = []
+    # Paths may start anywhere, as long as they can still reach both edges of the pair
+    for edges in edge_masks():
+        dists = [distance_to_edge(edge, open_mask) for edge in edges]
+        cells = open_mask
+        while cells:
+            low = cells & -cells
+            cell = low.bit_length() - 1
+            if dists[0][cell] is not None and dists[1][cell] is not None:
+                find_spangrams(cell, trie.root, 0, 0, "", [], open_mask, flat_letters, edges, dists, found_words)
+            cells ^= low
+
+    unique = {(word, tuple(path)) for word, path in found_words}
+    return sorted(((word, list(path)) for word, path in unique), key=lambda x: (-len(x[0]), x[0], x[1]))
+
+
+# Seed the cover search with each spangram candidate, keeping only the words that do not overlap it
+def find_spangram_solutions(all_words, num_candidates=5):
+    solutions = []
+    for spangram in generate_spangrams()[:num_candidates]:
+        spangram_mask = path_mask(spangram[1])
+        disjoint_words = [w for w in all_words if not path_mask(w[1]) & spangram_mask]
+        solution, covered_cells = greedy_cover_matrix(disjoint_words, seed=spangram)
+        solutions.append((solution, covered_cells, spangram[0]))
+    return solutions
+
+
 # Main solver function
-def solve_word_game():
-    all_words = generate_all_words()
+def solve_word_game(num_solutions=20, spangram_solved=False):
+    all_words = generate_all_words_bitboard()
 
-    # Find multiple solutions (including partial ones)
-    solutions = find_multiple_solutions(all_words, num_solutions=20)
+    # Seed covers with the spangram candidates unless the spangram is already blanked,
+    # then fill the remaining slots with unseeded greedy covers
+    solutions = []
+    if not spangram_solved:
+        solutions = find_spangram_solutions(all_words, num_candidates=min(5, num_solutions))
+    solutions += find_multiple_solutions(all_words, num_solutions=num_solutions - len(solutions))
+    print_solutions(solutions)
 
     if not solutions:
         print("No solution found.")
+    return solutions
 
 
+# Persistent board session: candidate paths are generated once and indexed by cell, so
+# blanking solved cells only invalidates the paths that run through them
+class BoardSession:
+    def __init__(self):
+        self.candidates = generate_all_words_bitboard()
+        self.cell_index = defaultdict(set)
+        for idx, (word, path) in enumerate(self.candidates):
+            for cell in path:
+                self.cell_index[cell].add(idx)
+        self.live = set(range(len(self.candidates)))
+
+    def remaining_words(self):
+        return [self.candidates[idx] for idx in sorted(self.live)]
+
+    def find_paths(self, word):
+        return [path for idx, (candidate, path) in enumerate(self.candidates) if idx in self.live and candidate == word]
+
+    def mark_solved(self, cells):
+        dead = set()
+        for i, j in cells:
+            letters[i][j] = '_'
+            dead |= self.cell_index.pop((i, j), set())
+        for idx in dead:
+            for cell in self.candidates[idx][1]:
+                if cell in self.cell_index:
+                    self.cell_index[cell].discard(idx)
+        self.live -= dead
+
+    # Cells still reachable by at least one live candidate path
+    def coverable_cells(self):
+        return {cell for cell, paths in self.cell_index.items() if paths}
+
+    def uncoverable_cells(self):
+        coverable = self.coverable_cells()
+        return [(i, j) for i in range(rows) for j in range(cols) if letters[i][j] != '_' and (i, j) not in coverable]
+
+
+# Interactive loop: enter each word as it is found and only the affected paths are dropped
+def interactive_session():
+    session = BoardSession()
+    while True:
+        print_solutions(find_multiple_solutions(session.remaining_words(), num_solutions=20))
+        dead_cells = session.uncoverable_cells()
+        if dead_cells:
+            print(f"No candidate word reaches cells: {dead_cells}")
+        for row in letters:
+            print(' '.join(row))
+
+        entry = input("Enter a solved word to blank out (empty to quit): ").strip().upper()
+        if not entry:
+            break
+        paths = session.find_paths(entry)
+        if not paths:
+            print(f"{entry} is not on the board.")
+            continue
+        path = paths[0]
+        if len(paths) > 1:
+            for idx, option in enumerate(paths, 1):
+                print(f"{idx}: {option}")
+            choice = input(f"{entry} has {len(paths)} paths, pick one [1]: ").strip()
+            if choice.isdigit() and 1 <= int(choice) <= len(paths):
+                path = paths[int(choice) - 1]
+        session.mark_solved(path)
+
+
+# Set to True to keep the board in memory and blank out words as you find them
+interactive = False
+num_solutions = 20
+spangram_solved = False  # Set to True once the spangram has been found and blanked
+
 # Run the solver
-solve_word_game()
+if interactive:
+    trie, max_word_length = load_dictionary(letters)
+    interactive_session()
+else:
+    # Re-running the same board returns the cached solutions instead of searching again
+    cache = ResultCache()
+    cache_key = cache.make_key('Strands', letters, lexicon_version, min_word_length=min_word_length,
+                               num_solutions=num_solutions, spangram_solved=spangram_solved,
+                               cache_format=cache_format)
+    solutions = cache.get(cache_key)
+    if solutions is None:
+        trie, max_word_length = load_dictionary(letters)
+        solutions = solve_word_game(num_solutions, spangram_solved)
+        cache.put(cache_key, solutions)
+    elif not solutions:
+        print("No solution found.")
+    else:
+        print_solutions(solutions)
+    print(f"Cache: {cache.stats()}")
 
 # Print the board after solving some parts of the puzzle
 for row in letters:
@@ -1,7 +1,11 @@
+import heapq
+import math
 import nltk
 import random
+import time
 from nltk.corpus import words, wordnet
 from collections import defaultdict
+from ResultCache import ResultCache
 
 # Ensure you have the necessary corpora downloaded
 nltk.download('words')
@@ -41,10 +45,9 @@ class Trie:
         return node.is_end_of_word
 
 
-# Load dictionary and create the Trie
-word_list = set(words.words())
 min_word_length = 4  # Filter shorter words
-trie = Trie()
+lexicon_version = f"nltk-words-wordnet-{nltk.__version__}"  # Part of the result cache key
+cache_format = 2  # Bump when the layout of cached solutions changes
 
 # Precompute word frequencies using WordNet
 def word_frequency(word):
@@ -53,12 +56,16 @@ def word_frequency(word):
         return 0  # If the word doesn't have a frequency, return 0
     return max(lemma.count() for synset in synsets for lemma in synset.lemmas())
 
-# Add words to the trie and store their frequencies
-word_frequencies = {}
-for word in word_list:
-    if len(word) >= min_word_length:
-        trie.insert(word.upper())
-        word_frequencies[word.upper()] = word_frequency(word)
+# Load dictionary, add words to the trie and store their frequencies
+def load_dictionary():
+    word_list = set(words.words())
+    trie = Trie()
+    word_frequencies = {}
+    for word in word_list:
+        if len(word) >= min_word_length:
+            trie.insert(word.upper())
+            word_frequencies[word.upper()] = word_frequency(word)
+    return trie, word_frequencies
 
 # This is where you can manually input the board after solving part of the puzzle by adding `_` manually
 letters = [
@@ -154,6 +161,13 @@ def greedy_cover_matrix(word_list):
     return selected_words, len(covered)
 
 
+# Solutions are (words, covered cells, score or None for greedy covers), shared by fresh and cached runs
+def print_solutions(solutions):
+    for idx, (solution, covered_cells, score) in enumerate(solutions, 1):
+        score_text = f"Score {score}, " if score is not None else ""
+        print(f"Solution {idx}: {solution} ({score_text}Covered {covered_cells}/{rows * cols} cells, Used {len(solution)} words)")
+
+
 def find_multiple_solutions(word_list, num_solutions=3):
     solutions = []
     all_words = word_list[:]
@@ -161,8 +175,7 @@ def find_multiple_solutions(word_list, num_solutions=3):
     for _ in range(num_solutions):
         solution, covered_cells = greedy_cover_matrix(all_words)
         if solution:
-            solutions.append((solution, covered_cells))
-            print(f"Solution {len(solutions)}: {solution} (Covered {covered_cells}/{rows * cols} cells, Used {len(solution)} words)")
+            solutions.append((solution, covered_cells, None))
 
             # Remove the selected words from the word list for the next solution
             all_words = [w for w in all_words if w[0] not in [sw for sw in solution]]
@@ -172,19 +185,147 @@ def find_multiple_solutions(word_list, num_solutions=3):
     return solutions
 
 
+# Exact search: branch and bound over sets of non-overlapping words that cover every open cell.
+# objective='frequency' maximizes the total word frequency, objective='words' minimizes the word count.
+def find_best_covers(word_list, top_k=10, objective='frequency', time_budget=5.0):
+    open_mask = 0
+    for i in range(rows):
+        for j in range(cols):
+            if letters[i][j] != '_':
+                open_mask |= 1 << (i * cols + j)
+
+    # Cell-bitmask candidates, indexed by every cell they cover
+    candidates = {}
+    for word, path in word_list:
+        mask = 0
+        for i, j in path:
+            mask |= 1 << (i * cols + j)
+        score = word_frequencies.get(word, 0) if objective == 'frequency' else -1
+        candidates[(word, mask)] = score
+    if not candidates:
+        return [], True
+    cell_candidates = defaultdict(list)
+    for (word, mask), score in candidates.items():
+        remaining = mask
+        while remaining:
+            low = remaining & -remaining
+            cell_candidates[low.bit_length() - 1].append((score, word, mask))
+            remaining ^= low
+    for options in cell_candidates.values():
+        options.sort(reverse=True)
+
+    # Upper bound on what the uncovered cells can still add to the score
+    if objective == 'frequency':
+        best_ratio = max(score / bin(mask).count('1') for (_, mask), score in candidates.items())
+
+        def bound(cells):
+            return cells * best_ratio
+    else:
+        max_cells = max(bin(mask).count('1') for _, mask in candidates)
+
+        def bound(cells):
+            return -math.ceil(cells / max_cells)
+
+    deadline = time.monotonic() + time_budget
+    best = []  # Min-heap of (score, words) holding the top_k covers found so far
+    best_keys = set()  # Sorted word tuples in best, so the same words via other paths count once
+    arrivals = {}  # Covered mask -> (min-heap of the best arrival scores, word tuples seen there)
+    dead_masks = set()  # Covered masks from which no exact cover exists
+    timed_out = False
+
+    def search(covered, score, chosen):
+        nonlocal timed_out
+        key = tuple(sorted(chosen))
+        if covered == open_mask:
+            if key not in best_keys:
+                best_keys.add(key)
+                heapq.heappush(best, (score, key))
+                if len(best) > top_k:
+                    best_keys.discard(heapq.heappop(best)[1])
+            return True, False
+        if timed_out or time.monotonic() > deadline:
+            timed_out = True
+            return False, True
+        if covered in dead_masks:
+            return False, False
+
+        uncovered = open_mask & ~covered
+        if len(best) == top_k and score + bound(bin(uncovered).count('1')) <= best[0][0]:
+            return False, True
+
+        # The same words reaching the same cells by other paths complete identically, and
+        # earlier arrivals with better scores already own the best completions
+        scores, seen_keys = arrivals.setdefault(covered, ([], set()))
+        if key in seen_keys or len(scores) == top_k and scores[0] >= score:
+            return False, True
+        seen_keys.add(key)
+        if len(scores) < top_k:
+            heapq.heappush(scores, score)
+        else:
+            heapq.heappushpop(scores, score)
+
+        # Branch on the lowest uncovered cell: every cover must use exactly one word through it
+        cell = (uncovered & -uncovered).bit_length() - 1
+        found_any = pruned = False
+        for word_score, word, mask in cell_candidates.get(cell, []):
+            if mask & covered:
+                continue
+            chosen.append(word)
+            found, cut = search(covered | mask, score + word_score, chosen)
+            chosen.pop()
+            found_any |= found
+            pruned |= cut
+            if timed_out:
+                break
+        if not found_any and not pruned:
+            dead_masks.add(covered)
+        return found_any, pruned
+
+    search(0, 0, [])
+    return [(score, list(words)) for score, words in sorted(best, reverse=True)], not timed_out
+
+
 # Main solver function
-def solve_word_game():
+def solve_word_game(num_solutions=10, objective='frequency', time_budget=5.0):
     all_words = generate_all_words()
 
-    # Find multiple solutions (including partial ones)
-    solutions = find_multiple_solutions(all_words, num_solutions=10)
+    # Prefer exact covers of the whole board, ranked by score
+    covers, complete = find_best_covers(all_words, num_solutions, objective, time_budget)
+    if not complete:
+        print(f"Exact search stopped after {time_budget}s, showing the best covers found so far.")
+    open_cells = sum(letter != '_' for row in letters for letter in row)
+    solutions = [(solution, open_cells, score) for score, solution in covers]
 
+    # Find multiple solutions (including partial ones) when no exact cover exists
     if not solutions:
-        print("No solution found.")
-
+        solutions = find_multiple_solutions(all_words, num_solutions=num_solutions)
 
-# Run the solver
-solve_word_game()
+    print_solutions(solutions)
+    if not solutions:
+        print("No solution found.")
+    return solutions, complete
+
+
+num_solutions = 10
+objective = 'frequency'  # Or 'words' to prefer covers with the fewest words
+time_budget = 5.0  # Seconds allowed for the exact cover search
+
+# Run the solver, reusing the cached solutions when this board was solved before
+cache = ResultCache()
+cache_key = cache.make_key('Strands2', letters, lexicon_version, min_word_length=min_word_length,
+                           num_solutions=num_solutions, objective=objective, cache_format=cache_format)
+solutions = cache.get(cache_key)
+if solutions is None:
+    trie, word_frequencies = load_dictionary()
+    solutions, complete = solve_word_game(num_solutions, objective, time_budget)
+    # A timed-out search depends on machine speed, so only finished searches are cached
+    if complete:
+        cache.put(cache_key, solutions)
+elif not solutions:
+    print("No solution found.")
+else:
+    print_solutions(solutions)
+print(f"Cache: {cache.stats()}")
 
 # Print the board after solving some parts of the puzzle
 for row in letters:
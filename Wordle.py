@@ -1,12 +1,10 @@
 import nltk
 from nltk.corpus import words
+from ResultCache import ResultCache
 
 # Download the words corpus if you haven't already
 nltk.download('words')
 
-# Get a list of all 5-letter words from the NLTK corpus
-word_list = [word.lower() for word in words.words() if len(word) == 5]
-
 # Inputs
 current_pattern = '_o__y'
 wrong_letters = set(['e', 'r', 't', 'u', 'i', 'p', 'a', 's', 'd', 'f', 'g', 'h', 'k', 'l', 'c', 'n'])
@@ -38,8 +36,23 @@ def guess_words(word_list, pattern, wrong_letters, wrong_positions):
             possible_words.append(word)
     return possible_words
 
-# Guess the possible words based on the current state
-possible_words = guess_words(word_list, current_pattern, wrong_letters, current_letters_wrong_position)
+# Reuse the cached guesses when this exact game state was solved before
+cache = ResultCache()
+cache_key = cache.make_key('Wordle', {
+    'pattern': current_pattern.lower(),
+    'wrong_letters': sorted(wrong_letters),
+    'wrong_positions': sorted(current_letters_wrong_position),
+}, f"nltk-words-{nltk.__version__}")
+possible_words = cache.get(cache_key)
+
+if possible_words is None:
+    # Get a list of all 5-letter words from the NLTK corpus
+    word_list = [word.lower() for word in words.words() if len(word) == 5]
+
+    # Guess the possible words based on the current state
+    possible_words = guess_words(word_list, current_pattern, wrong_letters, current_letters_wrong_position)
+    cache.put(cache_key, possible_words)
 
 # Print the possible words
 print("Possible words:", possible_words)
+print(f"Cache: {cache.stats()}")